@@ -1,14 +1,15 @@
 """CLI entry point for claude-worktrees."""
 
+import functools
 import os
-import subprocess
+import shutil
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
 from rich.console import Console
-from rich.table import Table
 
 from . import __version__
 from .config import (
@@ -19,25 +20,27 @@ from .config import (
     should_check_pr_status,
 )
 from .deps import cleanup_symlinks, setup_dependencies
-from .github import get_pr_for_branch, get_pr_status_badge, is_pr_closed
 from .hooks import install_all_hooks
 from .worktree import (
     branch_exists,
     create_branch,
     create_worktree,
+    disk_usage_map,
     format_size,
     get_git_root,
     get_main_branch,
+    get_merged_branches,
     get_repo_name,
     get_worktree_age_days,
-    get_worktree_disk_usage,
     get_worktree_path,
-    git_pull,
+    git_fast_forward,
+    git_fetch,
     has_remote,
     has_uncommitted_changes,
-    is_branch_merged,
     list_managed_worktrees,
+    needs_pull,
     remove_worktree,
+    uncommitted_map,
 )
 
 console = Console()
@@ -53,11 +56,18 @@ def ensure_git_repo():
     return git_root
 
 
+@functools.lru_cache(maxsize=1)
+def find_claude() -> str | None:
+    """Get the absolute path to the claude executable, or None if not on PATH."""
+    path = shutil.which("claude")
+    # PATH may hold relative entries; callers chdir before exec
+    return os.path.abspath(path) if path else None
+
+
 def auto_init():
     """Silently initialize if not already done (config + hooks)."""
     # Create config if needed
-    if not CONFIG_PATH.exists():
-        create_default_config()
+    create_default_config()
 
     # Create worktree base directory
     worktree_base = get_worktree_base()
@@ -80,23 +90,29 @@ def cli(ctx):
         git_root = ensure_git_repo()
         repo_name = get_repo_name()
 
-        # Auto-initialize (config, hooks) if not already done
-        auto_init()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Fetch in the background while initializing and preparing paths
+            fetch_future = executor.submit(git_fetch) if has_remote() else None
 
-        # Pull latest changes (triggers post-merge hook for cleanup)
-        if has_remote():
-            console.print("Pulling latest changes...")
-            git_pull()
+            # Auto-initialize (config, hooks) if not already done
+            auto_init()
 
-        # Create branch name from unix timestamp
-        timestamp = int(time.time())
-        branch = f"claude-{timestamp}"
+            # Create branch name from unix timestamp
+            timestamp = int(time.time())
+            branch = f"claude-{timestamp}"
+
+            # Get worktree path
+            worktree_path = get_worktree_path(branch)
 
-        # Get worktree path
-        worktree_path = get_worktree_path(branch)
+            # Create parent directory
+            worktree_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create parent directory
-        worktree_path.parent.mkdir(parents=True, exist_ok=True)
+            # Pull latest changes (triggers post-merge hook for cleanup).
+            # Only when behind: an up-to-date pull doesn't run the hook anyway.
+            # The merge itself waits for auto_init() so the hook is in place.
+            if fetch_future is not None and fetch_future.result() and needs_pull():
+                console.print("Pulling latest changes...")
+                git_fast_forward()
 
         console.print(f"Creating worktree [cyan]{branch}[/cyan] for [cyan]{repo_name}[/cyan]...")
 
@@ -121,10 +137,10 @@ def cli(ctx):
         console.print(f"  Path: [cyan]{worktree_path}[/cyan]")
 
         # Launch Claude Code
-        claude_result = subprocess.run(["which", "claude"], capture_output=True)
-        if claude_result.returncode == 0:
+        claude_path = find_claude()
+        if claude_path:
             os.chdir(worktree_path)
-            os.execvp("claude", ["claude", "--dangerously-skip-permissions"])
+            os.execv(claude_path, ["claude", "--dangerously-skip-permissions"])
         else:
             console.print("[yellow]Warning:[/yellow] Claude Code not found in PATH")
             console.print(f"  cd {worktree_path}")
@@ -139,8 +155,7 @@ def init():
     console.print(f"Initializing claude-worktrees for [cyan]{repo_name}[/cyan]")
 
     # Create config file if it doesn't exist
-    if not CONFIG_PATH.exists():
-        create_default_config()
+    if create_default_config():
         console.print(f"  [green]✓[/green] Created config file: {CONFIG_PATH}")
     else:
         console.print(f"  [dim]○[/dim] Config file already exists: {CONFIG_PATH}")
@@ -233,10 +248,10 @@ def new(branch: str | None, from_branch: str | None, no_deps: bool, no_claude: b
 
     if not no_claude:
         console.print("Launching Claude Code...")
-        claude_result = subprocess.run(["which", "claude"], capture_output=True)
-        if claude_result.returncode == 0:
+        claude_path = find_claude()
+        if claude_path:
             os.chdir(worktree_path)
-            os.execvp("claude", ["claude", "--dangerously-skip-permissions"])
+            os.execv(claude_path, ["claude", "--dangerously-skip-permissions"])
         else:
             console.print("[yellow]Warning:[/yellow] Claude Code not found in PATH")
             console.print(f"  cd {worktree_path}")
@@ -249,11 +264,21 @@ def list_cmd():
 
     worktrees = list_managed_worktrees()
 
+    # Plain output when piped: skip the table and the expensive columns
+    if not console.is_terminal:
+        for wt in worktrees:
+            click.echo(f"{wt.branch}\t{wt.path}")
+        return
+
     if not worktrees:
         console.print("[dim]No managed worktrees found.[/dim]")
         console.print("\nRun [cyan]cw[/cyan] to create one.")
         return
 
+    from rich.table import Table
+
+    from .github import get_pr_status_badge, get_prs_for_branches
+
     table = Table(title="Managed Worktrees")
     table.add_column("Branch", style="cyan")
     table.add_column("Path", style="dim")
@@ -261,25 +286,26 @@ def list_cmd():
     table.add_column("PR")
     table.add_column("Size", justify="right")
 
-    main_branch = get_main_branch()
+    merged = get_merged_branches(get_main_branch())
+    uncommitted = uncommitted_map([wt.path for wt in worktrees])
+    sizes = disk_usage_map([wt.path for wt in worktrees])
     check_pr = should_check_pr_status()
+    prs = get_prs_for_branches([wt.branch for wt in worktrees]) if check_pr else {}
 
     for wt in worktrees:
-        if has_uncommitted_changes(wt.path):
+        if uncommitted[wt.path]:
             status = "[yellow]modified[/yellow]"
-        elif is_branch_merged(wt.branch, main_branch):
+        elif wt.branch in merged:
             status = "[green]merged[/green]"
         else:
             status = "[dim]active[/dim]"
 
         if check_pr:
-            pr_info = get_pr_for_branch(wt.branch)
-            pr_badge = get_pr_status_badge(pr_info)
+            pr_badge = get_pr_status_badge(prs[wt.branch])
         else:
             pr_badge = "[dim]—[/dim]"
 
-        size = get_worktree_disk_usage(wt.path)
-        size_str = format_size(size)
+        size_str = format_size(sizes[wt.path])
 
         table.add_row(wt.branch, str(wt.path), status, pr_badge, size_str)
 
@@ -308,30 +334,37 @@ def cleanup(dry_run: bool, force: bool, auto: bool):
             console.print("[dim]No managed worktrees found.[/dim]")
         return
 
-    main_branch = get_main_branch()
+    from .github import get_prs_for_branches
+
+    merged = get_merged_branches(get_main_branch())
     check_pr = should_check_pr_status()
     max_age_days = 7  # Clean up worktrees older than 7 days with no active PR
 
+    # Branches merged locally are removed without asking GitHub. This only
+    # fires on git older than 2.23: newer git lists branches checked out in a
+    # worktree as "+ <branch>", which get_merged_branches() never matches, so
+    # every managed worktree still gets a PR lookup there.
+    unmerged = [wt.branch for wt in worktrees if wt.branch not in merged]
+    prs = get_prs_for_branches(unmerged) if check_pr else {}
+
     to_remove = []
 
     for wt in worktrees:
-        merged_git = is_branch_merged(wt.branch, main_branch)
-        closed_pr = is_pr_closed(wt.branch) if check_pr else False
-        age_days = get_worktree_age_days(wt.path)
-
-        # Check if worktree is stale (old with no active PR)
-        stale = False
-        if age_days >= max_age_days:
-            if check_pr:
-                pr_info = get_pr_for_branch(wt.branch)
-                # Stale if no PR or PR is not open
-                stale = pr_info is None or pr_info.is_closed
-            else:
-                # No GitHub - use age-based cleanup
-                stale = True
+        if wt.branch in merged:
+            to_remove.append(wt)
+            continue
 
-        if merged_git or closed_pr or stale:
+        pr_info = prs.get(wt.branch)
+        if pr_info is not None and pr_info.is_closed:
             to_remove.append(wt)
+            continue
+
+        # Check if worktree is stale (old with no active PR)
+        if get_worktree_age_days(wt.path) >= max_age_days:
+            # With GitHub, stale if there's no PR (closed PRs are caught above).
+            # No GitHub - use age-based cleanup.
+            if not check_pr or pr_info is None:
+                to_remove.append(wt)
 
     if not to_remove:
         if not auto:
@@ -417,11 +450,11 @@ def open_cmd(branch: str):
         console.print(f"[red]Error:[/red] No worktree found for branch '{branch}'")
         sys.exit(1)
 
-    claude_result = subprocess.run(["which", "claude"], capture_output=True)
-    if claude_result.returncode == 0:
+    claude_path = find_claude()
+    if claude_path:
         console.print(f"Launching Claude Code in {target.path}...")
         os.chdir(target.path)
-        os.execvp("claude", ["claude", "--dangerously-skip-permissions"])
+        os.execv(claude_path, ["claude", "--dangerously-skip-permissions"])
     else:
         console.print("[yellow]Warning:[/yellow] Claude Code not found in PATH")
         console.print(f"  cd {target.path}")
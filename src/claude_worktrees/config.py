@@ -1,15 +1,14 @@
 """Configuration file handling for claude-worktrees."""
 
+import functools
 import os
 import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
-
 
 DEFAULT_CONFIG = {
     "global": {
@@ -27,12 +26,45 @@ DEFAULT_CONFIG = {
 
 CONFIG_PATH = Path.home() / ".claude-worktrees.toml"
 
+DEFAULT_CONFIG_CONTENT = b'''# Claude Worktrees Configuration
 
-def load_config() -> dict[str, Any]:
-    """Load configuration from ~/.claude-worktrees.toml, with defaults."""
+[global]
+worktree_base = "~/.claude-worktrees"  # Where worktrees are stored
+auto_cleanup = true                     # Enable post-fetch cleanup
+
+[deps]
+strategy = "symlink"  # symlink | copy | custom | auto
+# Strategies:
+#   symlink - Symlink node_modules, .venv, etc. from main repo (fast, shared)
+#   copy    - Copy-on-write clone of dependency dirs (isolated; CoW on APFS, btrfs, XFS)
+#   custom  - Run post_create_hook command (full control)
+#   auto    - Detect lockfiles and run appropriate install command
+#
+# For custom strategy, set post_create_hook:
+# post_create_hook = "pnpm install --frozen-lockfile"
+
+[github]
+check_pr_status = true  # Use GitHub API to check if PR is merged
+'''
+
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> Mapping[str, Any]:
+    """Load configuration from ~/.claude-worktrees.toml, with defaults.
+
+    The file is parsed once per process; the result is read-only. Call
+    ``load_config.cache_clear()`` and ``get_config.cache_clear()`` after
+    changing the file to force a re-read.
+    """
     config = DEFAULT_CONFIG.copy()
 
     if CONFIG_PATH.exists():
+        # Imported lazily: the TOML parser is only needed when a config file exists
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
         with open(CONFIG_PATH, "rb") as f:
             user_config = tomllib.load(f)
 
@@ -43,67 +75,80 @@ def load_config() -> dict[str, Any]:
             else:
                 config[section] = values
 
-    return config
+    # Freeze each section too, so callers can't mutate DEFAULT_CONFIG through it
+    return MappingProxyType({
+        section: MappingProxyType(dict(values)) if isinstance(values, dict) else values
+        for section, values in config.items()
+    })
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Resolved claude-worktrees settings."""
+    worktree_base: Path
+    auto_cleanup: bool
+    deps_strategy: str
+    post_create_hook: str | None
+    check_pr_status: bool
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the resolved configuration, built once per process from load_config()."""
+    config = load_config()
+    return Config(
+        worktree_base=Path(os.path.expanduser(config["global"]["worktree_base"])),
+        auto_cleanup=config["global"]["auto_cleanup"],
+        deps_strategy=config["deps"]["strategy"],
+        post_create_hook=config["deps"].get("post_create_hook"),
+        check_pr_status=config["github"]["check_pr_status"],
+    )
 
 
 def get_worktree_base() -> Path:
     """Get the base directory for worktrees."""
-    config = load_config()
-    base = config["global"]["worktree_base"]
-    return Path(os.path.expanduser(base))
+    return get_config().worktree_base
 
 
 def get_deps_strategy() -> str:
     """Get the dependency sharing strategy."""
-    config = load_config()
-    return config["deps"]["strategy"]
+    return get_config().deps_strategy
 
 
 def get_post_create_hook() -> str | None:
     """Get the post-create hook command if configured."""
-    config = load_config()
-    return config["deps"].get("post_create_hook")
+    return get_config().post_create_hook
 
 
 def should_check_pr_status() -> bool:
     """Check if GitHub PR status checking is enabled."""
-    config = load_config()
-    return config["github"]["check_pr_status"]
+    return get_config().check_pr_status
 
 
 def should_auto_cleanup() -> bool:
     """Check if automatic cleanup is enabled."""
-    config = load_config()
-    return config["global"]["auto_cleanup"]
+    return get_config().auto_cleanup
 
 
-def create_default_config() -> None:
-    """Create a default configuration file if it doesn't exist."""
-    if CONFIG_PATH.exists():
-        return
-
-    default_content = '''# Claude Worktrees Configuration
+def create_default_config() -> bool:
+    """Create a default configuration file if it doesn't exist.
 
-[global]
-worktree_base = "~/.claude-worktrees"  # Where worktrees are stored
-auto_cleanup = true                     # Enable post-fetch cleanup
+    Returns:
+        True if the file was created, False if it already existed
+    """
+    try:
+        fd = os.open(CONFIG_PATH, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
 
-[deps]
-strategy = "symlink"  # symlink | copy | custom | auto
-# Strategies:
-#   symlink - Symlink node_modules, .venv, etc. from main repo (fast, shared)
-#   copy    - Copy-on-write clone of dependency dirs (isolated, macOS only)
-#   custom  - Run post_create_hook command (full control)
-#   auto    - Detect lockfiles and run appropriate install command
-#
-# For custom strategy, set post_create_hook:
-# post_create_hook = "pnpm install --frozen-lockfile"
-
-[github]
-check_pr_status = true  # Use GitHub API to check if PR is merged
-'''
+    try:
+        os.write(fd, DEFAULT_CONFIG_CONTENT)
+    finally:
+        os.close(fd)
 
-    CONFIG_PATH.write_text(default_content)
+    load_config.cache_clear()
+    get_config.cache_clear()
+    return True
 
 
 def get_repo_worktree_dir(repo_name: str) -> Path:
@@ -2,7 +2,11 @@
 
 import os
 import shutil
+import stat
 import subprocess
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .config import get_deps_strategy, get_post_create_hook
@@ -35,10 +39,7 @@ DEPENDENCY_DIRS = [
     "venv",
     "env",
 
-    # PHP (Composer)
-    "vendor",
-
-    # Go modules
+    # PHP (Composer) and Go modules
     "vendor",
 
     # Elixir/Mix
@@ -75,6 +76,14 @@ PACKAGE_MANAGER_RULES = [
     ("Cargo.lock", "cargo build", "cargo"),
 ]
 
+# Lockfile name -> (install_command, manager_name), plus the priority order
+_RULES_BY_FILENAME = {lockfile: (command, manager) for lockfile, command, manager in PACKAGE_MANAGER_RULES}
+_RULE_ORDER = [lockfile for lockfile, _, _ in PACKAGE_MANAGER_RULES]
+_LOCKFILES = frozenset(_RULE_ORDER)
+
+# Directories never searched for nested projects
+PROJECT_SKIP_DIRS = {"node_modules", "vendor", "dist", "build", "__pycache__"}
+
 # Map package managers to their ecosystem for deduplication
 ECOSYSTEM_MAP = {
     "pnpm": "node",
@@ -90,6 +99,25 @@ ECOSYSTEM_MAP = {
 }
 
 
+# cp invocations tried in order by the copy strategy. `cp -c` clones files on
+# APFS; GNU cp's --reflink=auto clones on btrfs/XFS and copies elsewhere.
+# COPY_LABEL describes what a successful first attempt means: `cp -c` fails
+# rather than copying when it can't clone, --reflink=auto doesn't.
+if sys.platform == "darwin":
+    COPY_COMMANDS = [["cp", "-cR"], ["cp", "-R"]]
+    COPY_LABEL = "CoW"
+else:
+    COPY_COMMANDS = [["cp", "--reflink=auto", "-R"], ["cp", "-R"]]
+    COPY_LABEL = "CoW where supported"
+
+# Cap on how much stderr is kept from long-running commands
+STDERR_LIMIT = 64 * 1024
+
+# Maximum number of install commands the auto strategy runs at once.
+# Override with the CW_AUTO_INSTALL_PARALLELISM environment variable.
+DEFAULT_AUTO_INSTALL_PARALLELISM = 8
+
+
 def setup_dependencies(worktree_path: Path, strategy: str | None = None) -> tuple[bool, str]:
     """Set up dependencies for a new worktree.
 
@@ -115,6 +143,42 @@ def setup_dependencies(worktree_path: Path, strategy: str | None = None) -> tupl
         return False, f"Unknown dependency strategy: {strategy}"
 
 
+def _scan_dirs(root: Path, max_depth: int = 2) -> Iterator[tuple[Path, set[str]]]:
+    """Walk root breadth-first, yielding each directory with its file names.
+
+    Each directory is listed once with os.scandir. Hidden directories and
+    PROJECT_SKIP_DIRS are not descended into, and symlinks are not followed.
+    """
+    # Breadth-first queue; subdirectories are appended while iterating
+    pending = [(str(root), 0)]
+
+    for path, depth in pending:
+        names = set()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if not is_dir:
+                        names.add(entry.name)
+                    elif (depth < max_depth and not entry.name.startswith(".")
+                          and entry.name not in PROJECT_SKIP_DIRS):
+                        pending.append((entry.path, depth + 1))
+        except OSError:
+            pass
+
+        yield Path(path), names
+
+
+def _match_lockfiles(files: set[str]) -> list[tuple[str, str]]:
+    """Get (install_command, manager_name) for each lockfile in files, by priority."""
+    if files.isdisjoint(_LOCKFILES):
+        return []
+    return [_RULES_BY_FILENAME[lockfile] for lockfile in _RULE_ORDER if lockfile in files]
+
+
 def _detect_package_managers(worktree_path: Path) -> list[tuple[Path, str, str]]:
     """Detect package managers in the worktree based on lockfiles.
 
@@ -127,14 +191,15 @@ def _detect_package_managers(worktree_path: Path) -> list[tuple[Path, str, str]]
     detected = []
     ecosystems_found = set()
 
+    dirs = _scan_dirs(worktree_path)
+    _, root_files = next(dirs)
+
     # First, check root directory for lockfiles (handles workspace monorepos)
-    for lockfile, command, manager in PACKAGE_MANAGER_RULES:
-        lockfile_path = worktree_path / lockfile
-        if lockfile_path.exists():
-            ecosystem = ECOSYSTEM_MAP.get(manager, manager)
-            if ecosystem not in ecosystems_found:
-                detected.append((worktree_path, command, manager))
-                ecosystems_found.add(ecosystem)
+    for command, manager in _match_lockfiles(root_files):
+        ecosystem = ECOSYSTEM_MAP.get(manager, manager)
+        if ecosystem not in ecosystems_found:
+            detected.append((worktree_path, command, manager))
+            ecosystems_found.add(ecosystem)
 
     # If we found lockfiles at root, we're done (workspace monorepo case)
     if detected:
@@ -142,30 +207,27 @@ def _detect_package_managers(worktree_path: Path) -> list[tuple[Path, str, str]]
 
     # No root lockfiles - search subdirectories (max depth 2)
     # This handles independent subfolder monorepos
-    for depth in range(1, 3):
-        pattern = "/".join(["*"] * depth)
-        for subdir in worktree_path.glob(pattern):
-            if not subdir.is_dir():
-                continue
-            # Skip hidden directories and common non-project dirs
-            if any(part.startswith(".") for part in subdir.relative_to(worktree_path).parts):
-                continue
-            if subdir.name in ("node_modules", "vendor", "dist", "build", "__pycache__"):
-                continue
-
-            for lockfile, command, manager in PACKAGE_MANAGER_RULES:
-                lockfile_path = subdir / lockfile
-                if lockfile_path.exists():
-                    ecosystem = ECOSYSTEM_MAP.get(manager, manager)
-                    # Track ecosystem per directory to allow different managers in different subdirs
-                    dir_ecosystem_key = (subdir, ecosystem)
-                    if dir_ecosystem_key not in ecosystems_found:
-                        detected.append((subdir, command, manager))
-                        ecosystems_found.add(dir_ecosystem_key)
+    for subdir, files in dirs:
+        for command, manager in _match_lockfiles(files):
+            ecosystem = ECOSYSTEM_MAP.get(manager, manager)
+            # Track ecosystem per directory to allow different managers in different subdirs
+            dir_ecosystem_key = (subdir, ecosystem)
+            if dir_ecosystem_key not in ecosystems_found:
+                detected.append((subdir, command, manager))
+                ecosystems_found.add(dir_ecosystem_key)
 
     return detected
 
 
+def _auto_install_parallelism() -> int:
+    """Get the max number of concurrent installs for the auto strategy."""
+    value = os.environ.get("CW_AUTO_INSTALL_PARALLELISM", "")
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return DEFAULT_AUTO_INSTALL_PARALLELISM
+
+
 def _setup_auto_install(worktree_path: Path) -> tuple[bool, str]:
     """Auto-detect project type and run appropriate install commands.
 
@@ -183,16 +245,33 @@ def _setup_auto_install(worktree_path: Path) -> tuple[bool, str]:
     results = []
     all_success = True
 
-    for directory, command, manager in detected:
-        rel_path = directory.relative_to(worktree_path) if directory != worktree_path else Path(".")
+    # Installs within one ecosystem can share state (site-packages, GEM_HOME,
+    # the yarn cache), so each ecosystem's installs run in order inside one
+    # worker; only different ecosystems run concurrently
+    groups: dict[str, list[int]] = {}
+    for index, (_, _, manager) in enumerate(detected):
+        groups.setdefault(ECOSYSTEM_MAP.get(manager, manager), []).append(index)
+
+    completed: list[subprocess.CompletedProcess | None] = [None] * len(detected)
+
+    def run_group(indices: list[int]) -> None:
+        for index in indices:
+            directory, command, _ = detected[index]
+            completed[index] = subprocess.run(
+                command,
+                shell=True,
+                cwd=directory,
+                capture_output=True,
+                text=True,
+            )
+
+    max_workers = min(len(groups), _auto_install_parallelism())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() re-raises any exception from a worker
+        list(executor.map(run_group, groups.values()))
 
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=directory,
-            capture_output=True,
-            text=True,
-        )
+    for (directory, command, manager), result in zip(detected, completed):
+        rel_path = directory.relative_to(worktree_path) if directory != worktree_path else Path(".")
 
         if result.returncode == 0:
             results.append(f"{manager} ({rel_path}): success")
@@ -208,47 +287,108 @@ def _setup_auto_install(worktree_path: Path) -> tuple[bool, str]:
     return all_success, message
 
 
+def _probe(path: Path | str) -> os.stat_result | None:
+    """lstat a path, returning None if it doesn't exist."""
+    try:
+        return os.lstat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _list_main_repo(main_repo: Path) -> tuple[set[str], set[str]]:
+    """List the top-level directories and files of the main repo in one pass.
+
+    Returns:
+        Tuple of (directory_names, file_names)
+    """
+    dirs = set()
+    files = set()
+
+    try:
+        with os.scandir(main_repo) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        dirs.add(entry.name)
+                    elif entry.is_file():
+                        files.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+    return dirs, files
+
+
+def _dep_dir_present(main_repo: Path, dep_dir: str, present_dirs: set[str]) -> bool:
+    """Check if a dependency directory exists in the main repo."""
+    top, _, rest = dep_dir.partition("/")
+    if top not in present_dirs:
+        return False
+    # Nested paths like vendor/bundle need one extra check below the top level
+    return not rest or os.path.isdir(os.path.join(main_repo, dep_dir))
+
+
+def _present_dep_dirs(main_repo: Path, present_dirs: set[str]) -> list[str]:
+    """Get the dependency directories to share from the main repo, in order.
+
+    Nested dirs like vendor/bundle are dropped when their top-level dir is
+    shared as a whole, since it already contains them.
+    """
+    found = [d for d in DEPENDENCY_DIRS if _dep_dir_present(main_repo, d, present_dirs)]
+    roots = {d for d in found if "/" not in d}
+    return [d for d in found if "/" not in d or d.split("/", 1)[0] not in roots]
+
+
+def _replace_with_symlink(src: str, dst: str, is_dir: bool = False) -> None:
+    """Symlink dst to src, replacing whatever is already at dst."""
+    try:
+        os.symlink(src, dst, target_is_directory=is_dir)
+        return
+    except FileExistsError:
+        pass
+
+    st = _probe(dst)
+    if st is not None and stat.S_ISDIR(st.st_mode):
+        shutil.rmtree(dst)
+    elif st is not None:
+        os.unlink(dst)
+    os.symlink(src, dst, target_is_directory=is_dir)
+
+
 def _setup_symlinks(worktree_path: Path) -> tuple[bool, str]:
     """Set up symlinks from main repo to worktree for dependencies and dotfiles."""
     main_repo = get_git_root()
     if not main_repo:
         return False, "Could not find main repository"
 
+    present_dirs, present_files = _list_main_repo(main_repo)
+    main_str = str(main_repo)
+    wt_str = str(worktree_path)
     linked = []
 
     # Symlink dependency directories
-    for dep_dir in DEPENDENCY_DIRS:
-        source = main_repo / dep_dir
-        target = worktree_path / dep_dir
-
-        if source.exists() and source.is_dir():
-            # Ensure parent directory exists for nested paths like vendor/bundle
-            target.parent.mkdir(parents=True, exist_ok=True)
-
-            # Remove existing directory if it exists
-            if target.exists():
-                if target.is_symlink():
-                    target.unlink()
-                else:
-                    shutil.rmtree(target)
+    for dep_dir in _present_dep_dirs(main_repo, present_dirs):
+        source = os.path.join(main_str, dep_dir)
+        target = os.path.join(wt_str, dep_dir)
+
+        # Ensure parent directory exists for nested paths like vendor/bundle
+        if "/" in dep_dir:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
 
-            # Create symlink
-            target.symlink_to(source)
-            linked.append(dep_dir)
+        _replace_with_symlink(source, target, is_dir=True)
+        linked.append(dep_dir)
 
     # Symlink dotfiles
     for dotfile in DOTFILES:
-        source = main_repo / dotfile
-        target = worktree_path / dotfile
+        if dotfile not in present_files:
+            continue
 
-        if source.exists() and source.is_file():
-            # Remove existing file if it exists
-            if target.exists() or target.is_symlink():
-                target.unlink()
+        source = os.path.join(main_str, dotfile)
+        target = os.path.join(wt_str, dotfile)
 
-            # Create symlink
-            target.symlink_to(source)
-            linked.append(dotfile)
+        _replace_with_symlink(source, target)
+        linked.append(dotfile)
 
     if linked:
         return True, f"Symlinked: {', '.join(linked)}"
@@ -257,42 +397,89 @@ def _setup_symlinks(worktree_path: Path) -> tuple[bool, str]:
 
 
 def _setup_copy_on_write(worktree_path: Path) -> tuple[bool, str]:
-    """Set up copy-on-write copies of dependency directories (macOS only)."""
+    """Set up copy-on-write copies of dependency directories.
+
+    Clones on APFS (macOS) and on btrfs/XFS (GNU cp); elsewhere falls back
+    to a regular copy.
+    """
     main_repo = get_git_root()
     if not main_repo:
         return False, "Could not find main repository"
 
+    present_dirs, _ = _list_main_repo(main_repo)
+
+    # Group by destination parent so each group is a single `cp` call
+    groups: dict[str, list[str]] = {}
+    for dep_dir in _present_dep_dirs(main_repo, present_dirs):
+        parent, _, _ = dep_dir.rpartition("/")
+        groups.setdefault(parent, []).append(dep_dir)
+
     copied = []
 
-    for dep_dir in DEPENDENCY_DIRS:
-        source = main_repo / dep_dir
-        target = worktree_path / dep_dir
+    for parent, batch in groups.items():
+        dest = worktree_path / parent if parent else worktree_path
+        dest.mkdir(parents=True, exist_ok=True)
 
-        if source.exists() and source.is_dir():
-            # Remove existing directory if it exists
-            if target.exists():
-                shutil.rmtree(target)
+        for attempt, cp_cmd in enumerate(COPY_COMMANDS):
+            # Remove existing (or partially copied) directories
+            for dep_dir in batch:
+                target = worktree_path / dep_dir
+                if target.exists():
+                    shutil.rmtree(target)
 
-            # Use cp -c for copy-on-write on macOS
             result = subprocess.run(
-                ["cp", "-cR", str(source), str(target)],
-                capture_output=True,
-                text=True,
+                [*cp_cmd, "--", *(str(main_repo / d) for d in batch), str(dest)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
             if result.returncode == 0:
-                copied.append(dep_dir)
-            else:
-                # Fallback to regular copy if CoW not supported
-                shutil.copytree(source, target)
+                if attempt == 0:
+                    copied.extend(batch)
+                else:
+                    copied.extend(f"{dep_dir} (regular copy)" for dep_dir in batch)
+                break
+        else:
+            # Last resort if no cp variant worked
+            for dep_dir in batch:
+                target = worktree_path / dep_dir
+                if target.exists():
+                    shutil.rmtree(target)
+                shutil.copytree(main_repo / dep_dir, target, copy_function=shutil.copy2)
                 copied.append(f"{dep_dir} (regular copy)")
 
     if copied:
-        return True, f"Copied (CoW): {', '.join(copied)}"
+        return True, f"Copied ({COPY_LABEL}): {', '.join(copied)}"
     else:
         return True, "No dependency directories found to copy"
 
 
+def _run_streaming(cmd: str, cwd: Path) -> tuple[int, str]:
+    """Run a shell command, discarding stdout and keeping only the tail of stderr.
+
+    Output is streamed rather than buffered, so noisy commands (e.g. a large
+    package install) use bounded memory.
+
+    Returns:
+        Tuple of (returncode, stderr_tail)
+    """
+    proc = subprocess.Popen(
+        cmd,
+        shell=True,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+    tail = bytearray()
+    with proc.stderr:
+        for chunk in iter(lambda: proc.stderr.read(STDERR_LIMIT), b""):
+            tail += chunk
+            del tail[:-STDERR_LIMIT]
+
+    return proc.wait(), tail.decode(errors="replace")
+
+
 def _run_custom_hook(worktree_path: Path) -> tuple[bool, str]:
     """Run a custom post-create hook for dependency setup."""
     hook_cmd = get_post_create_hook()
@@ -300,28 +487,19 @@ def _run_custom_hook(worktree_path: Path) -> tuple[bool, str]:
     if not hook_cmd:
         return True, "No custom hook configured"
 
-    result = subprocess.run(
-        hook_cmd,
-        shell=True,
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-    )
+    returncode, stderr = _run_streaming(hook_cmd, worktree_path)
 
-    if result.returncode == 0:
+    if returncode == 0:
         return True, f"Custom hook completed: {hook_cmd}"
     else:
-        return False, f"Custom hook failed: {result.stderr}"
+        return False, f"Custom hook failed: {stderr}"
 
 
 def cleanup_symlinks(worktree_path: Path) -> None:
     """Clean up symlinks before removing a worktree."""
-    for dep_dir in DEPENDENCY_DIRS:
-        target = worktree_path / dep_dir
-        if target.is_symlink():
-            target.unlink()
-
-    for dotfile in DOTFILES:
-        target = worktree_path / dotfile
-        if target.is_symlink():
-            target.unlink()
+    wt_str = str(worktree_path)
+    for name in (*DEPENDENCY_DIRS, *DOTFILES):
+        target = os.path.join(wt_str, name)
+        st = _probe(target)
+        if st is not None and stat.S_ISLNK(st.st_mode):
+            os.unlink(target)
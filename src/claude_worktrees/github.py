@@ -1,11 +1,17 @@
 """GitHub PR status checking using the gh CLI."""
 
+import functools
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Max PRs fetched by the bulk lookup; branches beyond it are queried one by one
+PR_LIST_LIMIT = 200
+
+
 class PRState(Enum):
     """State of a GitHub pull request."""
     OPEN = "open"
@@ -32,25 +38,83 @@ class PRInfo:
         return self.state in (PRState.MERGED, PRState.CLOSED)
 
 
+# gh PR state strings -> PRState
+_STATE_MAP = {
+    "OPEN": PRState.OPEN,
+    "MERGED": PRState.MERGED,
+    "CLOSED": PRState.CLOSED,
+}
+
+_NO_PR_BADGE = "[dim]no PR[/dim]"
+
+_BADGE_MAP = {
+    PRState.OPEN: "[green]PR #{n} open[/green]",
+    PRState.MERGED: "[magenta]PR #{n} merged[/magenta]",
+    PRState.CLOSED: "[red]PR #{n} closed[/red]",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def is_gh_available() -> bool:
-    """Check if the gh CLI is available and authenticated."""
-    result = subprocess.run(
-        ["gh", "auth", "status"],
-        capture_output=True,
-    )
+    """Check if the gh CLI is available and authenticated.
+
+    The result is cached for the life of the process.
+    """
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "status"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        # gh is optional
+        return False
     return result.returncode == 0
 
 
-def get_pr_for_branch(branch: str) -> PRInfo | None:
-    """Get PR information for a branch using the gh CLI.
+def _parse_pr(pr: dict) -> PRInfo:
+    """Build a PRInfo from a `gh pr list --json` record."""
+    return PRInfo(
+        number=pr.get("number"),
+        title=pr.get("title", ""),
+        state=_STATE_MAP.get(pr.get("state", "").upper(), PRState.NOT_FOUND),
+        url=pr.get("url"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_all_prs() -> tuple[dict[str, dict], bool]:
+    """Fetch recent PRs for the repository with a single gh call.
 
     Returns:
-        PRInfo if a PR exists for the branch, None otherwise
+        Tuple of (PRs keyed by head branch, whether the listing is complete)
     """
-    if not is_gh_available():
-        return None
+    result = subprocess.run(
+        ["gh", "pr", "list", "--state", "all", "--json",
+         "number,title,state,url,headRefName", "--limit", str(PR_LIST_LIMIT)],
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        return {}, False
+
+    try:
+        prs = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        return {}, False
 
-    # Try to find a PR for this branch
+    by_branch: dict[str, dict] = {}
+    for pr in prs:
+        # gh lists newest first; keep the latest PR per branch
+        by_branch.setdefault(pr.get("headRefName", ""), pr)
+
+    return by_branch, len(prs) < PR_LIST_LIMIT
+
+
+@functools.lru_cache(maxsize=None)
+def _query_pr(branch: str) -> PRInfo | None:
+    """Look up the PR for a single branch with its own gh call."""
     result = subprocess.run(
         ["gh", "pr", "list", "--head", branch, "--state", "all", "--json",
          "number,title,state,url", "--limit", "1"],
@@ -65,42 +129,69 @@ def get_pr_for_branch(branch: str) -> PRInfo | None:
         prs = json.loads(result.stdout)
         if not prs:
             return None
+        return _parse_pr(prs[0])
+    except (json.JSONDecodeError, KeyError):
+        return None
 
-        pr = prs[0]
-        state_str = pr.get("state", "").upper()
 
-        if state_str == "OPEN":
-            state = PRState.OPEN
-        elif state_str == "MERGED":
-            state = PRState.MERGED
-        elif state_str == "CLOSED":
-            state = PRState.CLOSED
-        else:
-            state = PRState.NOT_FOUND
+def get_pr_for_branch(branch: str) -> PRInfo | None:
+    """Get PR information for a branch using the gh CLI.
 
-        return PRInfo(
-            number=pr.get("number"),
-            title=pr.get("title", ""),
-            state=state,
-            url=pr.get("url"),
-        )
-    except (json.JSONDecodeError, KeyError):
+    Lookups are served from a single bulk PR listing cached for the life of
+    the process.
+
+    Returns:
+        PRInfo if a PR exists for the branch, None otherwise
+    """
+    if not is_gh_available():
         return None
 
+    prs, complete = _fetch_all_prs()
+    if branch in prs:
+        return _parse_pr(prs[branch])
+    if complete:
+        return None
+
+    # Not in the bulk listing (older PR or the listing failed)
+    return _query_pr(branch)
+
+
+def get_prs_for_branches(branches: list[str]) -> dict[str, PRInfo | None]:
+    """Get PR information for several branches.
+
+    Returns:
+        Dict mapping each branch to its PRInfo (or None if no PR exists)
+    """
+    if not branches:
+        return {}
+    if not is_gh_available():
+        return dict.fromkeys(branches)
+
+    prs, complete = _fetch_all_prs()
+    results: dict[str, PRInfo | None] = {}
+    missing = []
+
+    for branch in branches:
+        if branch in prs:
+            results[branch] = _parse_pr(prs[branch])
+        elif complete:
+            results[branch] = None
+        else:
+            missing.append(branch)
+
+    # Only branches missing from an incomplete listing hit gh again, concurrently
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(len(missing), 8)) as executor:
+            results.update(zip(missing, executor.map(_query_pr, missing)))
+
+    return results
+
 
 def get_pr_status_badge(pr_info: PRInfo | None) -> str:
     """Get a colored status badge for a PR."""
     if pr_info is None:
-        return "[dim]no PR[/dim]"
-
-    if pr_info.state == PRState.OPEN:
-        return f"[green]PR #{pr_info.number} open[/green]"
-    elif pr_info.state == PRState.MERGED:
-        return f"[magenta]PR #{pr_info.number} merged[/magenta]"
-    elif pr_info.state == PRState.CLOSED:
-        return f"[red]PR #{pr_info.number} closed[/red]"
-    else:
-        return "[dim]no PR[/dim]"
+        return _NO_PR_BADGE
+    return _BADGE_MAP.get(pr_info.state, _NO_PR_BADGE).format(n=pr_info.number)
 
 
 def is_pr_merged(branch: str) -> bool:
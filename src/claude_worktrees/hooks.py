@@ -1,6 +1,7 @@
 """Git hook installation for automatic cleanup."""
 
 import os
+import re
 import stat
 from pathlib import Path
 
@@ -8,6 +9,7 @@ from .worktree import get_git_root
 
 
 POST_FETCH_HOOK = '''#!/bin/bash
+# >>> claude-worktrees >>>
 # Claude Worktrees - Automatic cleanup hook
 # This hook runs after 'git fetch' to clean up merged worktrees
 
@@ -15,9 +17,11 @@ POST_FETCH_HOOK = '''#!/bin/bash
 if command -v cw &> /dev/null; then
     cw cleanup --auto 2>/dev/null || true
 fi
+# <<< claude-worktrees <<<
 '''
 
 POST_MERGE_HOOK = '''#!/bin/bash
+# >>> claude-worktrees >>>
 # Claude Worktrees - Automatic cleanup hook
 # This hook runs after 'git merge' (including pull) to clean up merged worktrees
 
@@ -25,9 +29,31 @@ POST_MERGE_HOOK = '''#!/bin/bash
 if command -v cw &> /dev/null; then
     cw cleanup --auto 2>/dev/null || true
 fi
+# <<< claude-worktrees <<<
 '''
 
 
+# Matches the section installed by install_hook, delimited by marker comments.
+# Also takes the blank separator line and, when appended to an existing hook,
+# the shebang that came with it.
+_BLOCK_RE = re.compile(
+    r"^\n?(?:(?<=\n)#!/bin/bash\n)?"
+    r"# >>> claude-worktrees >>>\n.*?# <<< claude-worktrees <<<\n?",
+    re.DOTALL | re.MULTILINE,
+)
+
+# Matches the unmarked section written by earlier versions
+_LEGACY_BLOCK_RE = re.compile(
+    r"^\n?(?:(?<=\n)#!/bin/bash\n)?"
+    r"# Claude Worktrees - Automatic cleanup hook\n(?:#.*\n)*\n?"
+    r"# Check if cw command exists\n"
+    r"if command -v cw &> /dev/null; then\n"
+    r"    cw cleanup --auto 2>/dev/null \|\| true\n"
+    r"fi\n?",
+    re.MULTILINE,
+)
+
+
 def get_hooks_dir() -> Path | None:
     """Get the git hooks directory for the current repository."""
     git_root = get_git_root()
@@ -134,23 +160,7 @@ def uninstall_hooks() -> list[tuple[str, bool, str]]:
             continue
 
         # Remove our section from the hook
-        lines = content.split("\n")
-        new_lines = []
-        skip_until_empty = False
-
-        for line in lines:
-            if "Claude Worktrees" in line:
-                skip_until_empty = True
-                continue
-            if skip_until_empty:
-                if line.strip() == "" or line.startswith("#"):
-                    continue
-                if line.startswith("if command") or line.startswith("    cw cleanup") or line.startswith("fi"):
-                    continue
-                skip_until_empty = False
-            new_lines.append(line)
-
-        new_content = "\n".join(new_lines).strip()
+        new_content = _LEGACY_BLOCK_RE.sub("", _BLOCK_RE.sub("", content)).strip()
 
         if new_content and new_content != "#!/bin/bash":
             hook_path.write_text(new_content + "\n")
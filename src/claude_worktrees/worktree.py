@@ -1,15 +1,17 @@
 """Git worktree operations."""
 
+import functools
 import os
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 from .config import get_repo_worktree_dir
 
 
-@dataclass
+@dataclass(slots=True)
 class WorktreeInfo:
     """Information about a git worktree."""
     path: Path
@@ -20,12 +22,18 @@ class WorktreeInfo:
     prunable: bool = False
 
 
+@functools.lru_cache(maxsize=1)
 def get_git_root() -> Path | None:
-    """Get the root directory of the current git repository."""
+    """Get the root directory of the current git repository.
+
+    The result is cached for the life of the process; the CLI doesn't change
+    its working directory before it is done with the repository.
+    """
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True,
         )
@@ -42,8 +50,12 @@ def get_repo_name() -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def get_main_branch() -> str:
-    """Get the main branch name (main or master)."""
+    """Get the main branch name (main or master).
+
+    The result is cached for the life of the process.
+    """
     try:
         result = subprocess.run(
             ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
@@ -58,7 +70,8 @@ def get_main_branch() -> str:
         for branch in ["main", "master"]:
             result = subprocess.run(
                 ["git", "rev-parse", "--verify", f"refs/heads/{branch}"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             if result.returncode == 0:
                 return branch
@@ -74,7 +87,8 @@ def branch_exists(branch: str, remote: bool = False) -> bool:
 
     result = subprocess.run(
         ["git", "rev-parse", "--verify", ref],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     return result.returncode == 0
 
@@ -85,7 +99,8 @@ def create_branch(branch: str, start_point: str | None = None) -> bool:
     if start_point:
         cmd.append(start_point)
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    get_merged_branches.cache_clear()
     return result.returncode == 0
 
 
@@ -101,45 +116,35 @@ def list_worktrees() -> list[WorktreeInfo]:
         return []
 
     worktrees = []
-    current_worktree: dict = {}
+    path = branch = commit = ""
+    is_bare = is_detached = prunable = False
 
-    for line in result.stdout.strip().split("\n"):
+    # Trailing blank line flushes the last record inside the loop
+    for line in result.stdout.split("\n") + [""]:
         if not line:
-            if current_worktree:
+            if path:
                 worktrees.append(WorktreeInfo(
-                    path=Path(current_worktree.get("worktree", "")),
-                    branch=current_worktree.get("branch", "").replace("refs/heads/", ""),
-                    commit=current_worktree.get("HEAD", ""),
-                    is_bare=current_worktree.get("bare", False),
-                    is_detached=current_worktree.get("detached", False),
-                    prunable=current_worktree.get("prunable", False),
+                    path=Path(path),
+                    branch=branch.removeprefix("refs/heads/"),
+                    commit=commit,
+                    is_bare=is_bare,
+                    is_detached=is_detached,
+                    prunable=prunable,
                 ))
-                current_worktree = {}
-            continue
-
-        if line.startswith("worktree "):
-            current_worktree["worktree"] = line[9:]
+            path = branch = commit = ""
+            is_bare = is_detached = prunable = False
+        elif line.startswith("worktree "):
+            path = line[9:]
         elif line.startswith("HEAD "):
-            current_worktree["HEAD"] = line[5:]
+            commit = line[5:]
         elif line.startswith("branch "):
-            current_worktree["branch"] = line[7:]
+            branch = line[7:]
         elif line == "bare":
-            current_worktree["bare"] = True
+            is_bare = True
         elif line == "detached":
-            current_worktree["detached"] = True
+            is_detached = True
         elif line.startswith("prunable"):
-            current_worktree["prunable"] = True
-
-    # Don't forget the last worktree
-    if current_worktree:
-        worktrees.append(WorktreeInfo(
-            path=Path(current_worktree.get("worktree", "")),
-            branch=current_worktree.get("branch", "").replace("refs/heads/", ""),
-            commit=current_worktree.get("HEAD", ""),
-            is_bare=current_worktree.get("bare", False),
-            is_detached=current_worktree.get("detached", False),
-            prunable=current_worktree.get("prunable", False),
-        ))
+            prunable = True
 
     return worktrees
 
@@ -150,6 +155,12 @@ def list_managed_worktrees() -> list[WorktreeInfo]:
     if not repo_name:
         return []
 
+    # Every linked worktree, prunable ones included, has an entry under
+    # .git/worktrees; without it there's nothing to list, so skip git
+    git_dir = get_git_root() / ".git"
+    if git_dir.is_dir() and not (git_dir / "worktrees").is_dir():
+        return []
+
     worktree_dir = get_repo_worktree_dir(repo_name)
     all_worktrees = list_worktrees()
 
@@ -174,6 +185,9 @@ def create_worktree(branch: str, path: Path, create_branch: bool = False) -> tup
 
     result = subprocess.run(cmd, capture_output=True, text=True)
 
+    if create_branch:
+        get_merged_branches.cache_clear()
+
     if result.returncode == 0:
         return True, f"Created worktree at {path}"
     else:
@@ -203,15 +217,34 @@ def has_uncommitted_changes(path: Path) -> bool:
     """Check if a worktree has uncommitted changes."""
     result = subprocess.run(
         ["git", "status", "--porcelain"],
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
         cwd=path,
     )
     return bool(result.stdout.strip())
 
 
-def is_branch_merged(branch: str, into: str | None = None) -> bool:
-    """Check if a branch has been merged into another branch (default: main)."""
+def uncommitted_map(paths: list[Path]) -> dict[Path, bool]:
+    """Check several worktrees for uncommitted changes concurrently.
+
+    Returns:
+        Dict mapping each path to whether it has uncommitted changes
+    """
+    if not paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), 16)) as executor:
+        return dict(zip(paths, executor.map(has_uncommitted_changes, paths)))
+
+
+@functools.lru_cache(maxsize=None)
+def get_merged_branches(into: str | None = None) -> frozenset[str]:
+    """Get the set of branches merged into another branch (default: main).
+
+    The result is cached; functions here that create branches or move
+    them (create_branch, create_worktree, git_fast_forward) clear it.
+    """
     if into is None:
         into = get_main_branch()
 
@@ -222,10 +255,16 @@ def is_branch_merged(branch: str, into: str | None = None) -> bool:
     )
 
     if result.returncode != 0:
-        return False
+        return frozenset()
+
+    # Branches checked out in a worktree are listed as "+ <branch>" and are
+    # deliberately left unmatched, so a worktree is never reported as merged
+    return frozenset(b.strip().lstrip("* ") for b in result.stdout.splitlines())
+
 
-    merged_branches = [b.strip().lstrip("* ") for b in result.stdout.strip().split("\n")]
-    return branch in merged_branches
+def is_branch_merged(branch: str, into: str | None = None) -> bool:
+    """Check if a branch has been merged into another branch (default: main)."""
+    return branch in get_merged_branches(into)
 
 
 def get_worktree_path(branch: str) -> Path:
@@ -241,68 +280,138 @@ def get_worktree_path(branch: str) -> Path:
 
 
 def get_worktree_disk_usage(path: Path) -> int:
-    """Get disk usage in bytes for a worktree directory."""
+    """Get disk usage in bytes for a worktree directory.
+
+    Symlinks are not followed, so dependency directories symlinked from the
+    main repo are not counted.
+    """
+    def usage(st: os.stat_result) -> int:
+        # st_blocks is in 512-byte units (what du reports); not on Windows
+        return st.st_blocks * 512 if hasattr(st, "st_blocks") else st.st_size
+
     try:
-        result = subprocess.run(
-            ["du", "-sk", str(path)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        # du -sk returns KB
-        kb = int(result.stdout.split()[0])
-        return kb * 1024
-    except (subprocess.CalledProcessError, ValueError, IndexError):
+        total = usage(os.lstat(path))
+    except OSError:
         return 0
 
+    stack = [str(path)]
+
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+
+        with it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                except OSError:
+                    continue
+                total += usage(st)
+
+    return total
+
+
+def disk_usage_map(paths: list[Path]) -> dict[Path, int]:
+    """Get disk usage for several worktrees concurrently.
+
+    Returns:
+        Dict mapping each path to its disk usage in bytes
+    """
+    if not paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as executor:
+        return dict(zip(paths, executor.map(get_worktree_disk_usage, paths)))
+
+
+_SIZE_UNITS = (("B", 1), ("KB", 1 << 10), ("MB", 1 << 20), ("GB", 1 << 30), ("TB", 1 << 40))
+
 
 def format_size(size_bytes: int) -> str:
     """Format a size in bytes to a human-readable string."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # (bit_length - 1) // 10 is floor(log1024(n)), i.e. the unit index
+    index = (int(size_bytes).bit_length() - 1) // 10
+    unit, divisor = _SIZE_UNITS[min(max(index, 0), len(_SIZE_UNITS) - 1)]
+    return f"{size_bytes / divisor:.1f} {unit}"
 
 
+@functools.lru_cache(maxsize=None)
 def has_remote() -> bool:
-    """Check if the repository has a remote configured."""
+    """Check if the repository has a remote configured.
+
+    The result is cached for the life of the process.
+    """
     result = subprocess.run(
         ["git", "remote"],
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
     )
     return bool(result.stdout.strip())
 
 
-def git_pull() -> tuple[bool, str]:
-    """Run git pull. Returns (success, message)."""
-    if not has_remote():
-        return True, "No remote configured"
+def git_fetch() -> bool:
+    """Run git fetch quietly. Returns True on success."""
+    result = subprocess.run(
+        ["git", "fetch", "--quiet"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return result.returncode == 0
+
 
+def needs_pull() -> bool:
+    """Check if the current branch is behind its upstream.
+
+    Compares against the last fetched state, so run git_fetch() first.
+    """
     result = subprocess.run(
-        ["git", "pull", "--ff-only"],
+        ["git", "rev-list", "--count", "HEAD..@{u}"],
         capture_output=True,
         text=True,
     )
 
+    if result.returncode != 0:
+        # No upstream configured (or detached HEAD) - nothing to pull
+        return False
+
+    try:
+        return int(result.stdout.strip()) > 0
+    except ValueError:
+        return False
+
+
+def git_fast_forward() -> tuple[bool, str]:
+    """Fast-forward the current branch to its fetched upstream.
+
+    Does not fetch; run git_fetch() first. Returns (success, message).
+    """
+    result = subprocess.run(
+        ["git", "merge", "--ff-only", "@{u}"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    get_merged_branches.cache_clear()
+
     if result.returncode == 0:
-        return True, "Pulled latest changes"
+        return True, "Fast-forwarded to upstream"
     else:
-        # Don't fail on pull errors (might be offline, etc.)
-        return True, "Could not pull (offline or conflicts)"
+        # Don't fail if the branch has diverged, etc.
+        return True, "Could not fast-forward (diverged or conflicts)"
 
 
 def get_worktree_age_days(path: Path) -> int:
     """Get the age of a worktree in days based on last modification time."""
     try:
         # Use the .git file in the worktree as the reference
-        git_file = path / ".git"
-        if git_file.exists():
-            mtime = git_file.stat().st_mtime
-        else:
+        try:
+            mtime = (path / ".git").stat().st_mtime
+        except FileNotFoundError:
             mtime = path.stat().st_mtime
-
         age_seconds = time.time() - mtime
         return int(age_seconds / 86400)  # Convert to days
     except (OSError, ValueError):